@@ -47,8 +47,10 @@ sys.path.append(os.path.join(os.path.dirname(__name__), '..'))
 dir_path = os.path.dirname(os.path.realpath(__file__))
 init_string = open(os.path.join(dir_path, '..', 'mosfit',
                                 '__init__.py')).read()
+version_string = open(os.path.join(dir_path, '..', 'mosfit',
+                                   '_version.py')).read()
 VERS = r"^__version__ = ['\"]([^'\"]*)['\"]"
-mo = re.search(VERS, init_string, re.M)
+mo = re.search(VERS, version_string, re.M)
 __version__ = mo.group(1)
 AUTH = r"^__author__ = ['\"]([^'\"]*)['\"]"
 mo = re.search(AUTH, init_string, re.M)
@@ -1,14 +1,8 @@
 """MOSFiT: Modular light curve fitting software."""
 import os
+from importlib import import_module
 
-import astrocats
-
-from . import constants  # noqa: F401
-from . import fitter  # noqa: F401
-from . import model  # noqa: F401
-from . import plotting  # noqa: F401
-from . import printer  # noqa: F401
-from . import utils  # noqa: F401
+from ._version import __version__  # noqa: F401
 
 authors = []
 contributors = []
@@ -22,27 +16,57 @@ with open(os.path.join(dir_name, 'contributors.txt')) as f:
         else:
             contributors.append(cont.split('(')[0].strip())
 
-__version__ = '1.1.8'
 __author__ = ' & '.join([', '.join(authors[:-1]), authors[-1]])
 __contributors__ = ' & '.join([', '.join(contributors[:-1]), contributors[-1]])
 __license__ = 'MIT'
 
-# Check astrocats version for schema compatibility.
-right_astrocats = True
-vparts = astrocats.__version__.split('.')
-req_path = os.path.join(dir_name, 'requirements.txt')
-with open(req_path, 'r') as f:
-    for req in f.read().splitlines():
-        if 'astrocats' in req:
-            vneed = req.split('=')[-1].split('.')
-            if int(vparts[0]) < int(vneed[0]):
-                right_astrocats = False
-            elif int(vparts[1]) < int(vneed[1]):
-                right_astrocats = False
-            elif int(vparts[2]) < int(vneed[2]):
-                right_astrocats = False
-if not right_astrocats:
-    raise ImportError(
-        'Installed `astrocats` package is out of date for this version of '
-        'MOSFiT, please upgrade your `astrocats` install to a version >= `' +
-        '.'.join(vneed) + '` with either `pip` or `conda`.')
+# Submodules are imported on first access (e.g. `mosfit.fitter`) so that
+# lightweight entry points such as the command line parser do not pull in
+# `astrocats`, `numpy`, `astropy`, and friends.
+_SUBMODULES = ('constants', 'converter', 'fetcher', 'fitter', 'model',
+               'plotting', 'printer', 'utils')
+
+_checked_astrocats = False
+
+
+def _check_astrocats():
+    """Check astrocats version for schema compatibility."""
+    global _checked_astrocats
+    if _checked_astrocats:
+        return
+
+    import astrocats
+
+    right_astrocats = True
+    vparts = astrocats.__version__.split('.')
+    req_path = os.path.join(dir_name, 'requirements.txt')
+    with open(req_path, 'r') as f:
+        for req in f.read().splitlines():
+            if 'astrocats' in req:
+                vneed = req.split('=')[-1].split('.')
+                if int(vparts[0]) < int(vneed[0]):
+                    right_astrocats = False
+                elif int(vparts[1]) < int(vneed[1]):
+                    right_astrocats = False
+                elif int(vparts[2]) < int(vneed[2]):
+                    right_astrocats = False
+    if not right_astrocats:
+        raise ImportError(
+            'Installed `astrocats` package is out of date for this version '
+            'of MOSFiT, please upgrade your `astrocats` install to a version '
+            '>= `' + '.'.join(vneed) + '` with either `pip` or `conda`.')
+    _checked_astrocats = True
+
+
+def __getattr__(name):
+    """Import MOSFiT submodules lazily."""
+    if name in _SUBMODULES:
+        _check_astrocats()
+        return import_module('.' + name, __name__)
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__():
+    """List module attributes, including lazily imported submodules."""
+    return sorted(set(globals()) | set(_SUBMODULES))
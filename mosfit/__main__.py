@@ -1,5 +1,5 @@
 """Entry point for MOSFiT scripts."""
 
 if __name__ == "__main__":
-    from . import main
-    main.main()
+    from . import _cli
+    _cli.main_cli()
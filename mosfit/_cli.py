@@ -0,0 +1,624 @@
+# -*- encoding: utf-8 -*-
+"""Command line interface for MOSFiT, kept free of heavy imports."""
+
+import argparse
+import sys
+from copy import deepcopy
+
+_parsers = {}
+
+
+class SortingHelpFormatter(argparse.ArgumentDefaultsHelpFormatter):
+    """Sort argparse arguments by argument name."""
+
+    def add_arguments(self, actions):
+        """Add sorting action based on `option_strings`."""
+        actions = sorted(actions, key=lambda action: action.option_strings)
+        super(SortingHelpFormatter, self).add_arguments(actions)
+
+
+class FreshDefaultsParser(argparse.ArgumentParser):
+    """Argument parser that never shares its list defaults.
+
+    `get_parser` reuses parsers, and argparse stores defaults on the returned
+    namespace without copying them, so a caller extending e.g. `time_list`
+    in place would otherwise alter the default for every later parse.
+    """
+
+    def parse_known_args(self, args=None, namespace=None):
+        """Parse arguments, giving the namespace copies of list defaults."""
+        namespace, extras = super(FreshDefaultsParser, self).parse_known_args(
+            args, namespace)
+        for action in self._actions:
+            if (isinstance(action.default, list) and getattr(
+                    namespace, action.dest, None) is action.default):
+                setattr(namespace, action.dest, deepcopy(action.default))
+        return namespace, extras
+
+
+class StoreConstIfEmpty(argparse.Action):
+    """Store `const` when an option accepting `*` arguments is given none."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        """Store the given values, or `const` if no values were given."""
+        setattr(namespace, self.dest, values if values else self.const)
+
+
+def _add_band_and_exclude_args(parser, prt):
+    """Add arguments selecting which bands and observations are fit."""
+    parser.add_argument(
+        '--band-list',
+        '--extra-bands',
+        dest='band_list',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_band_list'))
+
+    parser.add_argument(
+        '--band-systems',
+        '--extra-systems',
+        dest='band_systems',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_band_systems'))
+
+    parser.add_argument(
+        '--band-instruments',
+        '--extra-instruments',
+        dest='band_instruments',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_band_instruments'))
+
+    parser.add_argument(
+        '--band-bandsets',
+        '--extra-bandsets',
+        dest='band_bandsets',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_band_bandsets'))
+
+    parser.add_argument(
+        '--band-sampling-points',
+        dest='band_sampling_points',
+        type=int,
+        default=25,
+        help=prt.text('parser_band_sampling_points'))
+
+    parser.add_argument(
+        '--exclude-bands',
+        dest='exclude_bands',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_exclude_bands'))
+
+    parser.add_argument(
+        '--exclude-instruments',
+        dest='exclude_instruments',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_exclude_instruments'))
+
+    parser.add_argument(
+        '--exclude-systems',
+        dest='exclude_systems',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_exclude_systems'))
+
+    parser.add_argument(
+        '--exclude-sources',
+        dest='exclude_sources',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_exclude_sources'))
+
+    parser.add_argument(
+        '--exclude-kinds',
+        dest='exclude_kinds',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_exclude_kinds'))
+
+
+def get_parser(only=None, printer=None):
+    """Retrieve MOSFiT's `argparse.ArgumentParser` object.
+
+    Parsers are cached by `only` and the printer's language, so callers
+    should not modify the returned parser. List defaults are copied on each
+    parse, so the parsed values themselves may be modified freely.
+    """
+    language = 'en' if printer is None else printer._language
+    key = (only, None if only == 'language' else language)
+    if key not in _parsers:
+        _parsers[key] = _build_parser(only=only, printer=printer)
+    return _parsers[key]
+
+
+def _build_parser(only=None, printer=None):
+    """Construct MOSFiT's `argparse.ArgumentParser` object."""
+    parser = FreshDefaultsParser(
+        prog='mosfit',
+        description='Fit astrophysical transients.',
+        formatter_class=SortingHelpFormatter,
+        add_help=only is None)
+
+    parser.add_argument(
+        '--language',
+        dest='language',
+        type=str,
+        const='select',
+        default='en',
+        nargs='?',
+        help=("Language for output text."))
+
+    if only == 'language':
+        return parser
+
+    if printer is None:
+        from mosfit.printer import Printer
+        printer = Printer()
+    prt = printer
+
+    parser.add_argument(
+        '--events',
+        '-e',
+        dest='events',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_events'))
+
+    parser.add_argument(
+        '--models',
+        '-m',
+        dest='models',
+        default=[],
+        nargs='?',
+        help=prt.text('parser_models'))
+
+    parser.add_argument(
+        '--parameter-paths',
+        '-P',
+        dest='parameter_paths',
+        default=['parameters.json'],
+        nargs='+',
+        help=prt.text('parser_parameter_paths'))
+
+    parser.add_argument(
+        '--walker-paths',
+        '-w',
+        dest='walker_paths',
+        nargs='+',
+        help=prt.text('parser_walker_paths'))
+
+    parser.add_argument(
+        '--max-time',
+        dest='max_time',
+        type=float,
+        default=1000.,
+        help=prt.text('parser_max_time'))
+
+    parser.add_argument(
+        '--limiting-magnitude',
+        '-l',
+        dest='limiting_magnitude',
+        default=None,
+        nargs='+',
+        help=prt.text('parser_limiting_magnitude'))
+
+    parser.add_argument(
+        '--prefer-fluxes',
+        dest='prefer_fluxes',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_prefer_fluxes'))
+
+    parser.add_argument(
+        '--time-list',
+        '--extra-times',
+        dest='time_list',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_time_list'))
+
+    parser.add_argument(
+        '--extra-dates',
+        dest='date_list',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_time_list'))
+
+    parser.add_argument(
+        '--extra-mjds',
+        dest='mjd_list',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_time_list'))
+
+    parser.add_argument(
+        '--extra-jds',
+        dest='jd_list',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_time_list'))
+
+    parser.add_argument(
+        '--extra-phases',
+        dest='phase_list',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_time_list'))
+
+    _add_band_and_exclude_args(parser, prt)
+
+    parser.add_argument(
+        '--fix-parameters',
+        '-F',
+        dest='user_fixed_parameters',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_user_fixed_parameters'))
+
+    parser.add_argument(
+        '--release-parameters',
+        '-r',
+        dest='user_released_parameters',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_user_released_parameters'))
+
+    parser.add_argument(
+        '--iterations',
+        '-i',
+        dest='iterations',
+        type=int,
+        const=0,
+        default=-1,
+        nargs='?',
+        help=prt.text('parser_iterations'))
+
+    parser.add_argument(
+        '--generative',
+        '-G',
+        dest='generative',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_generative'))
+
+    parser.add_argument(
+        '--smooth-times',
+        '--plot-points',
+        '-S',
+        dest='smooth_times',
+        type=int,
+        const=0,
+        default=21,
+        nargs='?',
+        action='store',
+        help=prt.text('parser_smooth_times'))
+
+    parser.add_argument(
+        '--extrapolate-time',
+        '-E',
+        dest='extrapolate_time',
+        type=float,
+        default=0.0,
+        const=100.0,
+        nargs='*',
+        action=StoreConstIfEmpty,
+        help=prt.text('parser_extrapolate_time'))
+
+    parser.add_argument(
+        '--limit-fitting-mjds',
+        '-L',
+        dest='limit_fitting_mjds',
+        type=float,
+        default=False,
+        nargs=2,
+        help=prt.text('parser_limit_fitting_mjds'))
+
+    parser.add_argument(
+        '--output-path',
+        '-o',
+        dest='output_path',
+        default='',
+        help=prt.text('parser_output_path'))
+
+    parser.add_argument(
+        '--suffix',
+        '-s',
+        dest='suffix',
+        default='',
+        help=prt.text('parser_suffix'))
+
+    parser.add_argument(
+        '--num-walkers',
+        '-N',
+        dest='num_walkers',
+        type=int,
+        default=None,
+        help=prt.text('parser_num_walkers'))
+
+    parser.add_argument(
+        '--num-temps',
+        '-T',
+        dest='num_temps',
+        type=int,
+        help=prt.text('parser_num_temps'))
+
+    parser.add_argument(
+        '--no-fracking',
+        dest='fracking',
+        default=True,
+        action='store_false',
+        help=prt.text('parser_fracking'))
+
+    parser.add_argument(
+        '--no-write',
+        dest='write',
+        default=True,
+        action='store_false',
+        help=prt.text('parser_write'))
+
+    parser.add_argument(
+        '--quiet',
+        dest='quiet',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_quiet'))
+
+    parser.add_argument(
+        '--cuda',
+        dest='cuda',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_cuda'))
+
+    parser.add_argument(
+        '--no-copy-at-launch',
+        dest='copy',
+        default=True,
+        action='store_false',
+        help=prt.text('parser_copy'))
+
+    parser.add_argument(
+        '--force-copy-at-launch',
+        dest='force_copy',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_force_copy'))
+
+    parser.add_argument(
+        '--offline',
+        dest='offline',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_offline'))
+
+    parser.add_argument(
+        '--prefer-cache',
+        dest='prefer_cache',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_prefer_cache'))
+
+    parser.add_argument(
+        '--frack-step',
+        '-f',
+        dest='frack_step',
+        type=int,
+        help=prt.text('parser_frack_step'))
+
+    parser.add_argument(
+        '--burn', '-b', dest='burn', type=int, help=prt.text('parser_burn'))
+
+    parser.add_argument(
+        '--post-burn',
+        '-p',
+        dest='post_burn',
+        type=int,
+        help=prt.text('parser_post_burn'))
+
+    parser.add_argument(
+        '--upload',
+        '-u',
+        dest='upload',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_upload'))
+
+    parser.add_argument(
+        '--run-until-converged',
+        '-R',
+        dest='run_until_converged',
+        type=float,
+        default=False,
+        const=True,
+        nargs='?',
+        help=prt.text('parser_run_until_converged'))
+
+    parser.add_argument(
+        '--run-until-uncorrelated',
+        '-U',
+        dest='run_until_uncorrelated',
+        type=int,
+        default=None,
+        const=5,
+        nargs='?',
+        help=prt.text('parser_run_until_uncorrelated'))
+
+    parser.add_argument(
+        '--maximum-walltime',
+        '-W',
+        dest='maximum_walltime',
+        type=float,
+        default=False,
+        help=prt.text('parser_maximum_walltime'))
+
+    parser.add_argument(
+        '--maximum-memory',
+        '-M',
+        dest='maximum_memory',
+        type=float,
+        help=prt.text('parser_maximum_memory'))
+
+    parser.add_argument(
+        '--seed', dest='seed', type=int, help=prt.text('parser_seed'))
+
+    parser.add_argument(
+        '--draw-above-likelihood',
+        '-d',
+        dest='draw_above_likelihood',
+        type=float,
+        const=True,
+        nargs='?',
+        help=prt.text('parser_draw_above_likelihood'))
+
+    parser.add_argument(
+        '--gibbs',
+        '-g',
+        dest='gibbs',
+        action='store_const',
+        const=True,
+        help=prt.text('parser_gibbs'))
+
+    parser.add_argument(
+        '--save-full-chain',
+        '-c',
+        dest='save_full_chain',
+        action='store_const',
+        const=True,
+        help=prt.text('parser_save_full_chain'))
+
+    parser.add_argument(
+        '--print-trees',
+        dest='print_trees',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_print_trees'))
+
+    parser.add_argument(
+        '--set-upload-token',
+        dest='set_upload_token',
+        const=True,
+        default=False,
+        nargs='?',
+        help=prt.text('parser_set_upload_token'))
+
+    parser.add_argument(
+        '--ignore-upload-quality',
+        dest='check_upload_quality',
+        default=True,
+        action='store_false',
+        help=prt.text('parser_check_upload_quality'))
+
+    parser.add_argument(
+        '--test',
+        dest='test',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_test'))
+
+    parser.add_argument(
+        '--variance-for-each',
+        dest='variance_for_each',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_variance_for_each'))
+
+    parser.add_argument(
+        '--speak',
+        dest='speak',
+        const='en',
+        default=False,
+        nargs='?',
+        help=prt.text('parser_speak'))
+
+    parser.add_argument(
+        '--version',
+        dest='version',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_version'))
+
+    parser.add_argument(
+        '--extra-outputs',
+        '-x',
+        dest='extra_outputs',
+        default=None,
+        nargs='*',
+        help=prt.text('parser_extra_outputs'))
+
+    parser.add_argument(
+        '--catalogs',
+        '-C',
+        dest='catalogs',
+        default=[],
+        nargs='+',
+        help=prt.text('parser_catalogs'))
+
+    parser.add_argument(
+        '--no-guessing',
+        dest='no_guessing',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_no_guessing'))
+
+    parser.add_argument(
+        '--open-in-browser',
+        '-O',
+        dest='open_in_browser',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_open_in_browser'))
+
+    parser.add_argument(
+        '--exit-on-prompt',
+        dest='exit_on_prompt',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_exit_on_prompt'))
+
+    parser.add_argument(
+        '--download-recommended-data',
+        dest='download_recommended_data',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_download_recommended_data'))
+
+    parser.add_argument(
+        '--local-data-only',
+        dest='local_data_only',
+        default=False,
+        action='store_true',
+        help=prt.text('parser_local_data_only'))
+
+    parser.add_argument(
+        '--method',
+        '-D',
+        dest='method',
+        type=str,
+        const='select',
+        default='ensembler',
+        nargs='?',
+        help=prt.text('parser_method'))
+
+    parser.add_argument(
+        '--cache-path',
+        dest='cache_path',
+        default='',
+        help=prt.text('parser_cache_path'))
+
+    return parser
+
+
+def main_cli():
+    """Entry point for the `mosfit` console script."""
+    # Answer a bare version request without building the localized parser.
+    if sys.argv[1:] == ['--version']:
+        from mosfit._version import __version__
+        print('MOSFiT v{}'.format(__version__))
+        return
+
+    from mosfit.main import main
+    main()
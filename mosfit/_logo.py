@@ -1,3 +1,8 @@
+# -*- encoding: utf-8 -*-
+"""MOSFiT's ASCII logo, printed at launch."""
+from unicodedata import normalize
+
+LOGO = """\
 ╔═════════════════════════════════════════════════════════════════════════════════════════╗
 ║ !m;@@@#.@        :@@;      !e!g ``@@@@@          !e!r  :@@@@@                    !e!b  ::::,. `       !e║
 ║ !m`@@@@@@'      @@@@@@@  !e!g  @@@@@@@@@@':    !e!r   @@@@@@@@@ !e!y @@@@@@@@@@@@@.   !e!b @@@@@@@@@@@@@@ !e║
@@ -11,3 +16,6 @@
 ║ !m;@@@   @@@:   ,@@@    !e!g  @@@@@@@@@@@   !e!r  ;@@@@@@@@@@@   !e!y `@                !e!b   @'         !e║
 ║ !m;@@@   ,@#     @@#     !e!g  ;@@@@@@@,     !e!r  @@;@@@@@`                                      !e║
 ╚═════════════════════════════════════════════════════════════════════════════════════════╝
+"""  # noqa: E501
+
+LOGO_FIRSTLINE_WIDTH = len(normalize('NFC', LOGO.split('\n', 1)[0]))
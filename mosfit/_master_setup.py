@@ -0,0 +1,188 @@
+# -*- encoding: utf-8 -*-
+"""Launch-time setup performed only by the master process."""
+import os
+import re
+import sys
+
+from mosfit import __author__, __contributors__, __version__
+from mosfit.utils import open_atomic
+
+_TOKEN_RE = re.compile(r'^[A-Za-z0-9_\-]{64}\Z')
+
+
+def _scan_or_create(path):
+    """Return the set of names in directory `path`, creating it if absent."""
+    try:
+        return set(x.name for x in os.scandir(path))
+    except FileNotFoundError:
+        os.mkdir(path)
+        return set()
+
+
+def _master_setup(args, prt, dir_path):
+    """Print the logo, set the upload token, and copy user files."""
+    # Print our amazing ASCII logo.
+    if not args.quiet:
+        from mosfit._logo import LOGO, LOGO_FIRSTLINE_WIDTH
+
+        # Get hash of ourselves, preferring the one recorded at install time.
+        try:
+            from mosfit._version_hash import MOSFIT_HASH as mosfit_hash
+        except ImportError:
+            from mosfit.utils import get_mosfit_hash
+            mosfit_hash = get_mosfit_hash()
+
+        prt.prt(LOGO, colorify=True)
+        prt.message(
+            'byline',
+            reps=[__version__, mosfit_hash, __author__, __contributors__],
+            center=True,
+            colorify=True,
+            width=LOGO_FIRSTLINE_WIDTH,
+            wrapped=False)
+
+    # Get/set upload token
+    upload_token = ''
+    get_token_from_user = False
+    if args.set_upload_token:
+        if args.set_upload_token is not True:
+            upload_token = args.set_upload_token
+        get_token_from_user = True
+
+    upload_token_path = os.path.join(dir_path, 'cache', 'dropbox.token')
+
+    # Perform a few checks on upload before running (to keep size
+    # manageable)
+    if args.upload and not args.test and args.smooth_times > 100:
+        response = prt.prompt('ul_warning_smooth')
+        if response:
+            args.upload = False
+        else:
+            sys.exit()
+
+    if (args.upload and not args.test and args.num_walkers is not None
+            and args.num_walkers < 100):
+        response = prt.prompt('ul_warning_few_walkers')
+        if response:
+            args.upload = False
+        else:
+            sys.exit()
+
+    if (args.upload and not args.test and args.num_walkers
+            and args.num_walkers * args.num_temps > 500):
+        response = prt.prompt('ul_warning_too_many_walkers')
+        if response:
+            args.upload = False
+        else:
+            sys.exit()
+
+    if args.upload:
+        # A valid token file holds 64 characters plus an optional line
+        # ending, so check its size before opening it.
+        try:
+            token_size = os.stat(upload_token_path).st_size
+        except OSError:
+            token_size = 0
+        if token_size not in (64, 65, 66):
+            get_token_from_user = True
+        else:
+            with open(upload_token_path, 'r') as f:
+                upload_token = f.read().rstrip()
+            if not _TOKEN_RE.match(upload_token):
+                get_token_from_user = True
+
+    if get_token_from_user:
+        if args.test:
+            upload_token = ('1234567890abcdefghijklmnopqrstuvwxyz'
+                            '1234567890abcdefghijklmnopqr')
+        while not _TOKEN_RE.match(upload_token):
+            prt.message(
+                'no_ul_token', ['https://sne.space/mosfit/'], wrapped=True)
+            upload_token = prt.prompt('paste_token', kind='string')
+            if not _TOKEN_RE.match(upload_token):
+                prt.prt(
+                    'Error: Token must be exactly 64 letters, digits, '
+                    'dashes, or underscores.',
+                    wrapped=True)
+                continue
+            break
+        with open_atomic(upload_token_path, 'w') as f:
+            f.write(upload_token)
+
+    if args.upload:
+        prt.prt(
+            "Upload flag set, will upload results after completion.",
+            wrapped=True)
+        prt.prt("Dropbox token: " + upload_token, wrapped=True)
+
+    args.upload_token = upload_token
+
+    # Create the user directory structure, if it doesn't already exist.
+    if args.copy:
+        import shutil
+
+        prt.message('copying')
+        fc = False
+        if args.force_copy:
+            fc = prt.prompt('force_copy')
+        existing = set(x.name for x in os.scandir('.'))
+        for name in ('jupyter', 'modules', 'models'):
+            if name not in existing:
+                os.mkdir(name)
+
+        if not os.path.isfile(os.path.join('jupyter',
+                                           'mosfit.ipynb')) or fc:
+            shutil.copy(
+                os.path.join(dir_path, 'jupyter', 'mosfit.ipynb'),
+                os.path.join(os.getcwd(), 'jupyter', 'mosfit.ipynb'))
+
+        modules_path = os.path.join(dir_path, 'modules')
+        module_dirs = next(os.walk(modules_path))[1]
+        for mdir in module_dirs:
+            if mdir.startswith('__'):
+                continue
+            full_mdir = os.path.join(modules_path, mdir)
+            copy_path = os.path.join(full_mdir, '.copy')
+            to_copy = []
+            if os.path.isfile(copy_path):
+                to_copy = list(
+                    filter(None,
+                           open(copy_path, 'r').read().split()))
+
+            mdir_path = os.path.join('modules', mdir)
+            mdir_names = _scan_or_create(mdir_path)
+            for tc in to_copy:
+                tc_path = os.path.join(full_mdir, tc)
+                if os.path.isfile(tc_path):
+                    shutil.copy(tc_path, os.path.join(mdir_path, tc))
+                elif os.path.isdir(tc_path) and tc not in mdir_names:
+                    os.mkdir(os.path.join(mdir_path, tc))
+            if 'README' not in mdir_names:
+                readme_path = os.path.join(mdir_path, 'README')
+                txt = prt.message(
+                    'readme-modules', [full_mdir, modules_path],
+                    prt=False)
+                open(readme_path, 'w').write(txt)
+
+        models_path = os.path.join(dir_path, 'models')
+        for mentry in os.scandir(models_path):
+            mdir = mentry.name
+            if mdir.startswith('__') or not mentry.is_dir():
+                continue
+            mdir_path = os.path.join('models', mdir)
+            mdir_names = _scan_or_create(mdir_path)
+            if 'README' not in mdir_names:
+                readme_path = os.path.join(mdir_path, 'README')
+                txt = prt.message(
+                    'readme-models', [mentry.path, models_path],
+                    prt=False)
+                with open(readme_path, 'w') as f:
+                    f.write(txt)
+            for fentry in os.scandir(mentry.path):
+                if ('parameters.json' not in fentry.name
+                        or not fentry.is_file()):
+                    continue
+                if not fc and fentry.name in mdir_names:
+                    continue
+                shutil.copyfile(
+                    fentry.path, os.path.join(mdir_path, fentry.name))
@@ -0,0 +1,3 @@
+"""Version of MOSFiT, importable without loading the rest of the package."""
+
+__version__ = '1.1.8'
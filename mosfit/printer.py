@@ -207,11 +207,13 @@ class Printer(object):
         else:
             self._was_inline = False
 
-        for rline in rlines:
+        # Print all lines in one call rather than one call per line.
+        if rlines:
+            out = '\n'.join(rlines)
             try:
-                print(rline, flush=True)
+                print(out, flush=True)
             except UnicodeEncodeError:
-                print(rline.encode('ascii', 'replace').decode(), flush=True)
+                print(out.encode('ascii', 'replace').decode(), flush=True)
 
         self._last_prt_time = time.time()
 
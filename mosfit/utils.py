@@ -212,6 +212,9 @@ def get_mosfit_hash(salt=u''):
     for root, _, filenames in sorted(os.walk(dir_path)):
         for filename in fnmatch.filter(filenames, '*.py'):
             matches.append(os.path.join(root, filename))
+    # The build-time hash file is not part of the hashed code.
+    hash_path = os.path.join(dir_path, '_version_hash.py')
+    matches = [x for x in matches if x != hash_path]
 
     matches = list(sorted(list(matches)))
     code_str = salt
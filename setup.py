@@ -1,9 +1,12 @@
 """Setup script for MOSFiT."""
+import codecs
 import fnmatch
+import hashlib
 import os
 import re
 
 from setuptools import find_packages, setup
+from setuptools.command.build_py import build_py
 
 with open(os.path.join('mosfit', 'requirements.txt')) as f:
     required = f.read().splitlines()
@@ -14,8 +17,10 @@ with open(os.path.join('mosfit', 'dependencies.txt')) as f:
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
 init_string = open(os.path.join(dir_path, 'mosfit', '__init__.py')).read()
+version_string = open(
+    os.path.join(dir_path, 'mosfit', '_version.py')).read()
 VERS = r"^__version__ = ['\"]([^'\"]*)['\"]"
-mo = re.search(VERS, init_string, re.M)
+mo = re.search(VERS, version_string, re.M)
 __version__ = mo.group(1)
 AUTH = r"^__author__ = ['\"]([^'\"]*)['\"]"
 mo = re.search(AUTH, init_string, re.M)
@@ -30,6 +35,43 @@ for root, dirnames, filenames in os.walk('mosfit'):
         matches.append(os.path.join(root, filename))
 
 
+class BuildPyWithHash(build_py):
+    """Record the MOSFiT code hash in the built package.
+
+    Mirrors `mosfit.utils.get_mosfit_hash` so the installed package does not
+    have to re-read all of its sources to print the hash at launch.
+    """
+
+    def run(self):
+        """Build the package, then write `mosfit/_version_hash.py`."""
+        build_py.run(self)
+        # Editable installs use the source tree, where the hash is computed
+        # live, and leave `build_lib` unpopulated.
+        if self.dry_run or getattr(self, 'editable_mode', False):
+            return
+        pkg_path = os.path.join(self.build_lib, 'mosfit')
+        hash_path = os.path.join(pkg_path, '_version_hash.py')
+        # Only hash the sources produced by this build, not stale leftovers
+        # from earlier builds in the same `build_lib`.
+        py_files = [
+            x for x in self.get_outputs(include_bytecode=False)
+            if fnmatch.fnmatch(x, '*.py') and os.path.isfile(x)
+            and x != hash_path
+            and os.path.abspath(x).startswith(
+                os.path.abspath(pkg_path) + os.sep)]
+        code_str = u''
+        for py_file in sorted(py_files):
+            with codecs.open(py_file, 'r', 'utf-8') as f:
+                code_str += f.read()
+        mosfit_hash = hashlib.sha512(
+            code_str.encode('utf-8')).hexdigest()[:16]
+        if not os.path.isdir(pkg_path):
+            os.makedirs(pkg_path)
+        with open(hash_path, 'w') as f:
+            f.write('"""Hash of the MOSFiT code at build time."""\n\n'
+                    'MOSFIT_HASH = \'{}\'\n'.format(mosfit_hash))
+
+
 try:
     import pypandoc
     with open('README.md', 'r') as f:
@@ -43,8 +85,9 @@ setup(
     name='mosfit',
     packages=find_packages(),
     entry_points={'console_scripts': [
-        'mosfit = mosfit.main:main'
+        'mosfit = mosfit._cli:main_cli'
     ]},
+    cmdclass={'build_py': BuildPyWithHash},
     include_package_data=True,
     version=__version__,  # noqa
     description=('Modular software for fitting '
@@ -1,6 +1,7 @@
 """Run a test of instantiating `Fitter`, running `fit_events`."""
 import mosfit
 import numpy as np
+from mosfit.main import get_parser
 
 # Test running the fitter.
 my_fitter = mosfit.fitter.Fitter(quiet=False, test=True, offline=True)
@@ -31,3 +32,12 @@ print('Model likelihood: `{}`'.format(likelihood))
 outputs = my_model.run(x)
 
 print('Keys in output: `{}`'.format(', '.join(list(outputs.keys()))))
+
+# Test that reused parsers do not share default lists between parses.
+print('Testing default lists of cached parser.')
+first_args = get_parser().parse_args([])
+first_args.time_list += [55000.0]
+second_args = get_parser().parse_args([])
+
+assert second_args.time_list == []
+assert second_args.time_list is not first_args.time_list